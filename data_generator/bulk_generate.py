@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 # 실패 시 10초 대기 후 동일 감정 재시도. 목표 개수 보장.
 
-import argparse, json, os, random, time
+import argparse, os, random, time
 from datetime import datetime
 from typing import Dict, Any, List
 
 import config
+from company_catalog import get_catalog
 from generate_data import NewsGenerator
 
 def _log(msg: str):
@@ -31,15 +32,12 @@ def round_robin(items: List[Any]):
         i += 1
 
 def load_companies_json(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    industries = data.get("industries", [])
-    companies = data.get("companies", data if isinstance(data, list) else [])
-    id2name = {i.get("industry_id"): i.get("industry_name") for i in industries if "industry_id" in i}
-    for c in companies:
-        if "industry_name" not in c:
-            c["industry_name"] = id2name.get(c.get("industry_id"), c.get("industry", ""))
-    return {"industries": industries, "companies": companies}
+    catalog = get_catalog(path)
+    # run_company_counts가 목록을 섞으므로 호출자 전용 복사본을 반환
+    return {
+        "industries": [dict(i) for i in catalog.industries],
+        "companies": [dict(c) for c in catalog.companies],
+    }
 
 def try_generate_company_once(gen: NewsGenerator, company: Dict[str, Any], origin_sentiment: str) -> bool:
     """한 번 시도. 저장 성공 시 True."""
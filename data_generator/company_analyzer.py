@@ -4,29 +4,29 @@ from typing import List, Dict, Any, Tuple
 from collections import Counter
 import logging
 
+from company_catalog import CompanyCatalog, get_catalog
+
 logger = logging.getLogger(__name__)
 
 
 class CompanyAnalyzer:
-    def __init__(self, companies_file_path: str = './companies.json'):
+    def __init__(self, companies_file_path: str = './companies.json', weight_keys: Tuple[str, ...] = ()):
         """
         회사 데이터를 로드하고 분석기를 초기화합니다.
         
         Args:
             companies_file_path (str): 회사 데이터 JSON 파일 경로
+            weight_keys (Tuple[str, ...]): 가중치 샘플링에 사용할 회사 필드 (예: market_cap)
         """
-        self.companies_data = self._load_companies_data(companies_file_path)
-        self.industries = self.companies_data.get('industries', [])
-        self.companies = self.companies_data.get('companies', [])
+        self.catalog = self._load_catalog(companies_file_path, weight_keys)
+        self.industries = self.catalog.industries
+        self.companies = self.catalog.companies
         
         # 산업 ID -> 산업명 매핑
-        self.industry_id_to_name = {
-            industry['industry_id']: industry['industry_name'] 
-            for industry in self.industries
-        }
+        self.industry_id_to_name = self.catalog.industry_id_to_name
         
         # 산업명 리스트
-        self.industry_names = [industry['industry_name'] for industry in self.industries]
+        self.industry_names = list(self.catalog.industry_names)
         
         # 영향도 분석을 위한 키워드 사전
         self.positive_keywords = [
@@ -41,23 +41,23 @@ class CompanyAnalyzer:
         
         logger.info(f"회사 데이터 로딩 완료: {len(self.companies)}개 회사, {len(self.industries)}개 산업")
     
-    def _load_companies_data(self, file_path: str) -> Dict[str, Any]:
+    def _load_catalog(self, file_path: str, weight_keys: Tuple[str, ...] = ()) -> CompanyCatalog:
         """
-        JSON 파일에서 회사 및 산업 데이터를 로드합니다.
+        JSON 파일에서 회사 및 산업 데이터를 로드합니다. 같은 경로의 카탈로그는 공유됩니다.
+        파일을 읽을 수 없으면 빈 카탈로그를 사용하고, 잘못된 가중치(ValueError)는 그대로 전파합니다.
         
         Args:
             file_path (str): JSON 파일 경로
+            weight_keys (Tuple[str, ...]): 가중치 샘플링에 사용할 회사 필드
             
         Returns:
-            Dict[str, Any]: 회사 및 산업 데이터
+            CompanyCatalog: 회사 및 산업 카탈로그
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return data
-        except Exception as e:
+            return get_catalog(file_path, weight_keys)
+        except (OSError, json.JSONDecodeError) as e:
             logger.error(f"회사 데이터 로딩 실패: {e}")
-            return {"industries": [], "companies": []}
+            return CompanyCatalog([], [], weight_keys)
     
     def _analyze_impact_direction(self, text: str) -> Tuple[str, float]:
         """
@@ -110,42 +110,19 @@ class CompanyAnalyzer:
         logger.info(f"산업 영향도 분석 완료: {target_industry} - {impact_direction} ({impact_intensity:.3f})")
         return industry_impact
     
-    def get_random_company_by_industry(self, industry_name: str = None) -> Dict[str, Any]:
+    def get_random_company_by_industry(self, industry_name: str = None,
+                                       weight_key: str = None) -> Dict[str, Any]:
         """
         특정 산업 또는 랜덤 산업에서 회사를 선택합니다.
         
         Args:
             industry_name (str): 특정 산업명 (None이면 랜덤 선택)
+            weight_key (str): 가중치 필드명 (생성 시 weight_keys에 포함된 필드, None이면 균등 선택)
             
         Returns:
-            Dict[str, Any]: 선택된 회사 정보 (industry_name 추가)
+            Dict[str, Any]: 선택된 회사 정보 복사본 (industry_name 포함)
         """
-        import random
-        
-        if industry_name:
-            # 산업명으로 industry_id 찾기
-            industry_id = None
-            for industry in self.industries:
-                if industry['industry_name'] == industry_name:
-                    industry_id = industry['industry_id']
-                    break
-            
-            if industry_id:
-                # 특정 산업의 회사들 필터링
-                industry_companies = [c for c in self.companies if c['industry_id'] == industry_id]
-                if industry_companies:
-                    selected_company = random.choice(industry_companies)
-                else:
-                    selected_company = random.choice(self.companies)
-            else:
-                selected_company = random.choice(self.companies)
-        else:
-            # 전체에서 랜덤 선택
-            selected_company = random.choice(self.companies)
-        
-        # 산업명 추가
-        selected_company['industry_name'] = self.industry_id_to_name.get(
-            selected_company['industry_id'], ''
-        )
-        
-        return selected_company
\ No newline at end of file
+        company = self.catalog.sample(industry_name, weight_key=weight_key)
+        if company is None:
+            raise IndexError("선택할 회사가 없습니다")
+        return company
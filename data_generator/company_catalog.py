@@ -0,0 +1,275 @@
+import json
+import math
+import os
+import random
+import threading
+from bisect import bisect_right
+from itertools import accumulate
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple, Mapping, Iterable
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CompanyCatalog:
+    """
+    회사/산업 데이터를 한 번만 인덱싱해 두는 읽기 전용 카탈로그.
+
+    생성 이후에는 내부 상태를 변경하지 않으므로 여러 스레드에서 동시에 읽어도 안전합니다.
+    companies/industries는 읽기 전용 레코드 튜플을 그대로 반환하고,
+    단건 조회 및 샘플링 결과는 복사본(dict)으로 반환합니다.
+
+    industry_name 규칙:
+        - industry_id가 산업 목록에 있으면 항상 매핑된 산업명을 사용합니다
+          (레코드에 있던 industry_name은 무시).
+        - 매핑이 없으면 레코드의 industry_name, industry 순으로 사용합니다.
+
+    가중치 정책:
+        - 가중치 필드가 없는 회사는 가중치 0으로 처리하고 필드별로 한 번 경고 로그를 남깁니다.
+        - 숫자가 아니거나 유한하지 않거나(NaN, inf) 음수인 값은 ValueError를 발생시킵니다.
+    """
+
+    def __init__(self, industries: List[Dict[str, Any]], companies: List[Dict[str, Any]],
+                 weight_keys: Iterable[str] = ()):
+        """
+        Args:
+            industries (List[Dict[str, Any]]): 산업 목록 (industry_id, industry_name)
+            companies (List[Dict[str, Any]]): 회사 목록 (id, name, industry_id)
+            weight_keys (Iterable[str]): 가중치 샘플링용으로 미리 누적합을 계산할 회사 필드
+                (예: market_cap, news_weight)
+        """
+        self._industries = tuple(MappingProxyType(dict(i)) for i in industries)
+        self.industry_id_to_name: Mapping[str, str] = MappingProxyType({
+            i['industry_id']: i['industry_name']
+            for i in self._industries if 'industry_id' in i
+        })
+        self.industry_name_to_id: Mapping[str, str] = MappingProxyType({
+            name: industry_id for industry_id, name in self.industry_id_to_name.items()
+        })
+        self.industry_names: Tuple[str, ...] = tuple(
+            i['industry_name'] for i in self._industries if 'industry_name' in i
+        )
+
+        # industry_name은 industry_id 매핑을 우선하고, 매핑이 없을 때만 레코드 값을 사용
+        records = []
+        for c in companies:
+            record = dict(c)
+            industry_name = self.industry_id_to_name.get(record.get('industry_id'))
+            if industry_name is None:
+                industry_name = record.get('industry_name', record.get('industry', ''))
+            record['industry_name'] = industry_name
+            records.append(MappingProxyType(record))
+        self._companies: Tuple[Mapping[str, Any], ...] = tuple(records)
+
+        self._by_id: Mapping[str, Mapping[str, Any]] = self._index(self._companies, 'id')
+        self._by_name: Mapping[str, Mapping[str, Any]] = self._index(self._companies, 'name')
+
+        # 산업 ID -> 소속 회사 튜플 (industry_id가 없는 회사는 전체 풀에만 포함)
+        grouped: Dict[str, List[Mapping[str, Any]]] = {}
+        for c in self._companies:
+            if c.get('industry_id') is not None:
+                grouped.setdefault(c['industry_id'], []).append(c)
+        self._by_industry: Mapping[str, Tuple[Mapping[str, Any], ...]] = MappingProxyType(
+            {industry_id: tuple(items) for industry_id, items in grouped.items()}
+        )
+
+        # 가중치 필드 -> 전체 누적 가중치 / (가중치 필드, 산업 ID) -> 산업별 누적 가중치
+        self.weight_keys: Tuple[str, ...] = _normalize_weight_keys(weight_keys)
+        global_cumulative = {}
+        industry_cumulative = {}
+        for key in self.weight_keys:
+            global_cumulative[key] = tuple(accumulate(self._weights(self._companies, key)))
+            for industry_id, items in self._by_industry.items():
+                industry_cumulative[(key, industry_id)] = tuple(
+                    accumulate(self._weights(items, key, warn=False))
+                )
+        self._global_cumulative: Mapping[str, Tuple[float, ...]] = MappingProxyType(global_cumulative)
+        self._industry_cumulative: Mapping[Tuple[str, str], Tuple[float, ...]] = MappingProxyType(
+            industry_cumulative
+        )
+
+    @staticmethod
+    def _index(companies: Tuple[Mapping[str, Any], ...], field: str) -> Mapping[str, Mapping[str, Any]]:
+        """
+        회사 레코드를 주어진 필드로 인덱싱합니다. 중복 값은 첫 번째 회사를 유지하고 경고합니다.
+
+        Args:
+            companies (Tuple[Mapping[str, Any], ...]): 회사 레코드
+            field (str): 인덱스 필드명 (id, name)
+
+        Returns:
+            Mapping[str, Mapping[str, Any]]: 필드 값 -> 회사 레코드
+        """
+        index = {}
+        duplicates = []
+        for c in companies:
+            if field not in c:
+                continue
+            if c[field] in index:
+                duplicates.append(c[field])
+                continue
+            index[c[field]] = c
+        if duplicates:
+            logger.warning(f"중복 {field} {len(duplicates)}개 → 첫 번째 회사만 조회됨: {duplicates[:5]}")
+        return MappingProxyType(index)
+
+    @staticmethod
+    def _weights(companies: Tuple[Mapping[str, Any], ...], key: str, warn: bool = True) -> List[float]:
+        """
+        회사들의 가중치를 읽습니다. 필드가 없으면 0으로 처리합니다.
+
+        Args:
+            companies (Tuple[Mapping[str, Any], ...]): 회사 레코드
+            key (str): 가중치 필드명
+            warn (bool): 필드가 없는 회사가 있을 때 요약 경고 로그를 남길지 여부
+
+        Returns:
+            List[float]: 회사별 가중치
+
+        Raises:
+            ValueError: 가중치가 숫자가 아니거나, 유한하지 않거나, 음수인 경우
+        """
+        weights = []
+        missing = []
+        for c in companies:
+            if key not in c:
+                missing.append(c.get('id'))
+                weights.append(0.0)
+                continue
+            value = c[key]
+            try:
+                w = float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"잘못된 가중치 '{key}'={value!r}: {c.get('id')}") from None
+            if not math.isfinite(w) or w < 0:
+                raise ValueError(f"잘못된 가중치 '{key}'={value!r}: {c.get('id')}")
+            weights.append(w)
+        if warn and missing:
+            logger.warning(f"가중치 '{key}' 없음 → 0으로 처리: {len(missing)}개 회사 (예: {missing[:5]})")
+        return weights
+
+    @classmethod
+    def from_json(cls, file_path: str, weight_keys: Iterable[str] = ()) -> 'CompanyCatalog':
+        """
+        JSON 파일에서 카탈로그를 생성합니다.
+
+        Args:
+            file_path (str): 회사 데이터 JSON 파일 경로
+            weight_keys (Iterable[str]): 미리 누적합을 계산할 가중치 필드
+
+        Returns:
+            CompanyCatalog: 생성된 카탈로그
+        """
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, list):
+            return cls([], data, weight_keys)
+        return cls(data.get('industries', []), data.get('companies', []), weight_keys)
+
+    @property
+    def industries(self) -> Tuple[Mapping[str, Any], ...]:
+        return self._industries
+
+    @property
+    def companies(self) -> Tuple[Mapping[str, Any], ...]:
+        return self._companies
+
+    def __len__(self) -> int:
+        return len(self._companies)
+
+    def get_by_id(self, company_id: str) -> Optional[Dict[str, Any]]:
+        company = self._by_id.get(company_id)
+        return dict(company) if company is not None else None
+
+    def get_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        company = self._by_name.get(name)
+        return dict(company) if company is not None else None
+
+    def companies_in_industry(self, industry_name: str) -> List[Dict[str, Any]]:
+        industry_id = self.industry_name_to_id.get(industry_name)
+        return [dict(c) for c in self._by_industry.get(industry_id, ())]
+
+    def sample(self, industry_name: str = None, weight_key: str = None,
+               rng: random.Random = None) -> Optional[Dict[str, Any]]:
+        """
+        특정 산업 또는 전체에서 회사를 하나 샘플링합니다.
+
+        Args:
+            industry_name (str): 산업명 (None이거나 소속 회사가 없으면 전체에서 선택)
+            weight_key (str): 가중치 필드명 (None이면 균등 선택)
+            rng (random.Random): 사용할 난수 생성기 (None이면 random 모듈)
+
+        Returns:
+            Optional[Dict[str, Any]]: 선택된 회사 정보 복사본 (회사가 없으면 None)
+
+        Raises:
+            KeyError: weight_key가 생성 시 weight_keys에 포함되지 않은 경우
+            ValueError: 선택 대상 회사들의 가중치 합이 0인 경우
+        """
+        if weight_key is not None and weight_key not in self._global_cumulative:
+            raise KeyError(f"미리 계산되지 않은 가중치 필드: {weight_key}")
+
+        rng = rng or random
+        industry_id = self.industry_name_to_id.get(industry_name) if industry_name else None
+        pool = self._by_industry.get(industry_id, ())
+        if not pool:
+            industry_id = None
+            pool = self._companies
+        if not pool:
+            return None
+
+        if weight_key is None:
+            return dict(pool[rng.randrange(len(pool))])
+
+        if industry_id is None:
+            cumulative = self._global_cumulative[weight_key]
+        else:
+            cumulative = self._industry_cumulative[(weight_key, industry_id)]
+        total = cumulative[-1]
+        if total <= 0:
+            raise ValueError(f"가중치 '{weight_key}' 합이 0입니다: {industry_name or '전체'}")
+        index = bisect_right(cumulative, rng.random() * total)
+        return dict(pool[min(index, len(pool) - 1)])
+
+
+def _normalize_weight_keys(weight_keys: Iterable[str]) -> Tuple[str, ...]:
+    """
+    가중치 필드 목록을 튜플로 정규화합니다. 문자열 하나는 단일 필드로 취급합니다.
+
+    Args:
+        weight_keys (Iterable[str]): 가중치 필드명 또는 필드명 목록
+
+    Returns:
+        Tuple[str, ...]: 가중치 필드 튜플
+    """
+    if isinstance(weight_keys, str):
+        return (weight_keys,)
+    return tuple(weight_keys)
+
+
+_catalog_cache: Dict[Tuple[str, Tuple[str, ...]], CompanyCatalog] = {}
+_catalog_lock = threading.Lock()
+
+
+def get_catalog(file_path: str = './companies.json', weight_keys: Iterable[str] = ()) -> CompanyCatalog:
+    """
+    경로 및 가중치 필드별로 한 번만 생성된 공유 카탈로그를 반환합니다.
+
+    Args:
+        file_path (str): 회사 데이터 JSON 파일 경로
+        weight_keys (Iterable[str]): 미리 누적합을 계산할 가중치 필드
+
+    Returns:
+        CompanyCatalog: 공유 카탈로그
+    """
+    key = (os.path.abspath(file_path), _normalize_weight_keys(weight_keys))
+    catalog = _catalog_cache.get(key)
+    if catalog is None:
+        with _catalog_lock:
+            catalog = _catalog_cache.get(key)
+            if catalog is None:
+                catalog = CompanyCatalog.from_json(file_path, key[1])
+                _catalog_cache[key] = catalog
+                logger.info(f"회사 카탈로그 생성: {len(catalog)}개 회사 ({key[0]})")
+    return catalog
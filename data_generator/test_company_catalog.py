@@ -0,0 +1,219 @@
+import json
+import math
+import os
+import random
+import tempfile
+import threading
+from collections import Counter
+
+import company_catalog
+from company_analyzer import CompanyAnalyzer
+from company_catalog import CompanyCatalog, get_catalog
+
+INDUSTRIES = [
+    {"industry_id": "IND01", "industry_name": "IT/소프트웨어"},
+    {"industry_id": "IND02", "industry_name": "에너지/환경"},
+]
+
+
+def make_catalog(companies=None, weight_keys=("market_cap",)):
+    if companies is None:
+        companies = [
+            {"id": "C1", "name": "A", "industry_id": "IND01", "market_cap": 1},
+            {"id": "C2", "name": "B", "industry_id": "IND01", "market_cap": 1000},
+            {"id": "C3", "name": "C", "industry_id": "IND02", "market_cap": 1},
+        ]
+    return CompanyCatalog(INDUSTRIES, companies, weight_keys)
+
+
+def test_lookups():
+    catalog = make_catalog()
+    assert catalog.get_by_id("C2")["name"] == "B"
+    assert catalog.get_by_name("C")["id"] == "C3"
+    assert catalog.get_by_id("없음") is None
+    assert catalog.get_by_name("없음") is None
+    assert [c["id"] for c in catalog.companies_in_industry("IT/소프트웨어")] == ["C1", "C2"]
+    assert catalog.companies_in_industry("없음") == []
+
+
+def test_industry_name_follows_industry_id():
+    catalog = make_catalog([
+        {"id": "C1", "name": "A", "industry_id": "IND01", "industry_name": "옛이름"},
+        {"id": "C2", "name": "B", "industry": "기타"},
+    ], weight_keys=())
+    assert catalog.get_by_id("C1")["industry_name"] == "IT/소프트웨어"
+    assert catalog.get_by_id("C2")["industry_name"] == "기타"
+
+
+def test_unknown_industry_falls_back_to_all():
+    catalog = make_catalog()
+    rng = random.Random(0)
+    seen = {catalog.sample("없음", rng=rng)["id"] for _ in range(200)}
+    assert seen == {"C1", "C2", "C3"}
+
+
+def test_returned_dict_is_a_copy():
+    catalog = make_catalog()
+    company = catalog.get_by_id("C1")
+    company["name"] = "변경"
+    sampled = catalog.sample("IT/소프트웨어", rng=random.Random(0))
+    sampled["industry_name"] = "변경"
+    assert catalog.get_by_id("C1")["name"] == "A"
+    assert all(c["industry_name"] != "변경" for c in catalog.companies)
+
+
+def test_weighted_distribution():
+    catalog = make_catalog()
+    rng = random.Random(0)
+    counts = Counter(catalog.sample("IT/소프트웨어", "market_cap", rng)["id"] for _ in range(3000))
+    assert set(counts) <= {"C1", "C2"}
+    assert counts["C2"] > 2900
+
+
+def test_weighted_distribution_with_industry_less_companies():
+    catalog = make_catalog([
+        {"id": "C1", "name": "A", "industry_id": "IND01", "market_cap": 1},
+        {"id": "C2", "name": "B", "industry_id": "IND01", "market_cap": 1000},
+        {"id": "C3", "name": "C", "market_cap": 1},
+    ])
+    rng = random.Random(0)
+    counts = Counter(catalog.sample(weight_key="market_cap", rng=rng)["id"] for _ in range(3000))
+    assert counts["C2"] > 2900
+    assert catalog.companies_in_industry("없음") == []
+
+
+def test_missing_weight_is_zero():
+    catalog = make_catalog([
+        {"id": "C1", "name": "A", "industry_id": "IND01"},
+        {"id": "C2", "name": "B", "industry_id": "IND01", "market_cap": 5},
+    ])
+    rng = random.Random(0)
+    assert {catalog.sample(weight_key="market_cap", rng=rng)["id"] for _ in range(500)} == {"C2"}
+
+
+def test_invalid_weights_raise():
+    for bad in (math.nan, math.inf, -1, "큼"):
+        try:
+            make_catalog([{"id": "C1", "name": "A", "industry_id": "IND01", "market_cap": bad}])
+        except ValueError:
+            continue
+        raise AssertionError(f"{bad!r} 가중치가 허용됨")
+
+
+def test_unknown_weight_key_raises():
+    catalog = make_catalog()
+    try:
+        catalog.sample(weight_key="market_capp")
+    except KeyError:
+        return
+    raise AssertionError("미리 계산되지 않은 가중치 필드가 허용됨")
+
+
+def test_empty_catalog():
+    assert CompanyCatalog([], []).sample() is None
+
+
+def test_string_weight_keys_is_single_field():
+    catalog = make_catalog(weight_keys="market_cap")
+    assert catalog.weight_keys == ("market_cap",)
+
+
+def test_duplicate_id_keeps_first():
+    catalog = make_catalog([
+        {"id": "C1", "name": "A", "industry_id": "IND01"},
+        {"id": "C1", "name": "B", "industry_id": "IND02"},
+    ], weight_keys=())
+    assert catalog.get_by_id("C1")["name"] == "A"
+    assert catalog.get_by_name("B")["industry_id"] == "IND02"
+
+
+def write_json(data):
+    fd, path = tempfile.mkstemp(suffix=".json")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    return path
+
+
+def sample_data(market_cap=10):
+    return {
+        "industries": INDUSTRIES,
+        "companies": [
+            {"id": "C1", "name": "A", "industry_id": "IND01", "market_cap": market_cap},
+            {"id": "C2", "name": "B", "industry_id": "IND02", "market_cap": 1},
+        ],
+    }
+
+
+def test_get_catalog_is_cached():
+    path = write_json(sample_data())
+    try:
+        assert get_catalog(path) is get_catalog(path)
+        assert get_catalog(path, "market_cap") is get_catalog(path, ("market_cap",))
+        assert get_catalog(path) is not get_catalog(path, ("market_cap",))
+    finally:
+        os.remove(path)
+
+
+def test_get_catalog_concurrent_callers_share_instance():
+    path = write_json(sample_data())
+    results = []
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        results.append(get_catalog(path, ("market_cap",)))
+
+    try:
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(results) == 8
+        assert all(r is results[0] for r in results)
+        assert sum(1 for k in company_catalog._catalog_cache if k[0] == os.path.abspath(path)) == 1
+    finally:
+        os.remove(path)
+
+
+def test_analyzer_returns_copy():
+    path = write_json(sample_data())
+    try:
+        analyzer = CompanyAnalyzer(path, ("market_cap",))
+        company = analyzer.get_random_company_by_industry("IT/소프트웨어", "market_cap")
+        assert company["id"] == "C1"
+        company["name"] = "변경"
+        company["industry_name"] = "변경"
+        assert analyzer.catalog.get_by_id("C1")["name"] == "A"
+        assert CompanyAnalyzer(path, ("market_cap",)).companies[0]["industry_name"] == "IT/소프트웨어"
+    finally:
+        os.remove(path)
+
+
+def test_analyzer_missing_file_falls_back_to_empty():
+    analyzer = CompanyAnalyzer("./없는_파일.json", ("market_cap",))
+    assert len(analyzer.companies) == 0
+    for weight_key in (None, "market_cap"):
+        try:
+            analyzer.get_random_company_by_industry("IT/소프트웨어", weight_key)
+        except IndexError:
+            continue
+        raise AssertionError("빈 카탈로그에서 회사가 선택됨")
+
+
+def test_analyzer_invalid_weight_raises():
+    path = write_json(sample_data(market_cap=-5))
+    try:
+        CompanyAnalyzer(path, ("market_cap",))
+    except ValueError:
+        return
+    finally:
+        os.remove(path)
+    raise AssertionError("잘못된 가중치가 빈 카탈로그로 처리됨")
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"{name} OK")